@@ -9,12 +9,20 @@ This module provides additional mathematical functionality including:
 
 from __future__ import annotations
 
+import math
 from decimal import Decimal
-from typing import List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping
 
 import numpy as np
 
-from .dozenal_decimal_converter import decimal_to_dozenal, dozenal_to_decimal
+from .dozenal_decimal_converter import (
+    _float_to_limited_fraction,
+    _int_to_base12,
+    decimal_to_dozenal,
+    dozenal_to_decimal,
+)
 
 __all__ = [
     "polynomial_eval",
@@ -23,50 +31,168 @@ __all__ = [
     "eigenvalues",
 ]
 
+# Polynomials with at least this many terms use the jitted Horner kernel
+# when numba is installed (the "jit" extra); below it, converting to an
+# array costs more than the kernel saves.
+_HORNER_JIT_MIN_TERMS = 256
 
-def polynomial_eval(coefficients: List[float], x: float, frac_precision: int = 12) -> dict[str, str]:
+# Elements whose magnitude times 12**frac_precision reaches this go
+# through decimal_to_dozenal; below it the exact fraction arithmetic in
+# _array_to_dozenal is known to give the same digits.
+_EXACT_LIMIT = 2**53
+
+
+def _array_to_dozenal(arr: np.ndarray, frac_precision: int) -> list[str]:
+    """Format every element of a float array as a dozenal string.
+
+    Gives the same strings as ``decimal_to_dozenal`` for each element, but
+    without building a Decimal per value: each float is snapped to the
+    same nearby fraction ``n/d``, and its integer and truncated fractional
+    digits are read off ``divmod(n, d)`` and ``divmod(rem * scale, d)``.
+    Elements that are non-finite, too large at this scale, or whose scaled
+    fraction lands exactly on an integer (where the converter's rounding
+    guard decides the last digit) fall back to ``decimal_to_dozenal``.
+    """
+    values = np.asarray(arr, dtype=np.float64).ravel()
+    precision = max(frac_precision, 0)
+    scale = 12**precision
+    if scale >= _EXACT_LIMIT:
+        return [decimal_to_dozenal(value, frac_precision=frac_precision) for value in values.tolist()]
+    fits = np.isfinite(values) & (np.abs(values) * scale < _EXACT_LIMIT)
+
+    results: list[str] = []
+    for value, ok in zip(values.tolist(), fits.tolist()):
+        if ok:
+            numerator, denominator = value.as_integer_ratio()
+            if denominator > 10**9:
+                numerator, denominator = _float_to_limited_fraction(value)
+            whole, rem = divmod(abs(numerator), denominator)
+            frac, exact = divmod(rem * scale, denominator)
+            ok = not rem or exact
+        if not ok:
+            results.append(decimal_to_dozenal(value, frac_precision=frac_precision))
+            continue
+        text = _int_to_base12(whole)
+        if frac:
+            text += "." + _int_to_base12(frac).rjust(precision, "0").rstrip("0")
+        results.append("-" + text if numerator < 0 and (whole or frac) else text)
+    return results
+
+
+def polynomial_eval(coefficients: List[float], x: float, frac_precision: int = 12) -> Mapping[str, str]:
     """Evaluate a polynomial at a given point.
     
+    Results for hashable arguments are cached, so the returned mapping is
+    read-only.
+    
     Args:
         coefficients: List of polynomial coefficients [a0, a1, a2, ...] for a0 + a1*x + a2*x^2 + ...
         x: Point at which to evaluate
         frac_precision: Fractional precision for dozenal conversion
     
     Returns:
-        Dictionary with decimal and dozenal results
+        Mapping with decimal and dozenal results
     """
-    poly = np.poly1d(coefficients[::-1])  # poly1d expects highest degree first
-    result = float(poly(x))
+    coefficients = tuple(coefficients)
+    try:
+        hash((coefficients, x, frac_precision))
+        # 0.0 and -0.0 compare equal but can decide the sign of a zero
+        # result, so the signs of x and the coefficients are part of the
+        # cache key.
+        signs = (math.copysign(1.0, x), *(math.copysign(1.0, c) for c in coefficients))
+    except TypeError:
+        return _polynomial_eval(coefficients, x, frac_precision)
+    return _polynomial_eval_cached(signs, coefficients, x, frac_precision)
+
+
+def _polynomial_eval(coefficients: tuple[float, ...], x: float, frac_precision: int) -> Mapping[str, str]:
+    horner = _jit_horner() if len(coefficients) >= _HORNER_JIT_MIN_TERMS else None
+    if horner is not None:
+        result = float(horner(np.asarray(coefficients, dtype=np.float64), float(x)))
+    else:
+        # Horner's method: ((a_n*x + a_(n-1))*x + ...)*x + a0
+        result = 0.0
+        for c in reversed(coefficients):
+            result = result * x + c
+        result = float(result)
     
-    return {
+    return MappingProxyType({
         "decimal": str(result),
         "dozenal": decimal_to_dozenal(result, frac_precision=frac_precision)
-    }
+    })
+
+
+@lru_cache(maxsize=256)
+def _polynomial_eval_cached(
+    signs: tuple[float, ...], coefficients: tuple[float, ...], x: float, frac_precision: int
+) -> Mapping[str, str]:
+    return _polynomial_eval(coefficients, x, frac_precision)
+
 
+def _horner(coeffs: np.ndarray, x: float) -> float:
+    """Evaluate sum(coeffs[i] * x**i) by Horner's method over a float64 array.
 
-def trigonometric_functions(value: float, frac_precision: int = 12) -> dict[str, dict[str, str]]:
+    Compiled by ``_jit_horner``. fastmath is left off so the result
+    matches the pure-Python loop bit for bit.
+    """
+    acc = 0.0
+    for i in range(coeffs.size - 1, -1, -1):
+        acc = acc * x + coeffs[i]
+    return acc
+
+
+@lru_cache(maxsize=None)
+def _jit_horner():
+    """Return ``_horner`` compiled with numba, or None if numba is missing.
+
+    numba is imported on the first long polynomial rather than with this
+    module, so ordinary CLI runs never pay for loading it.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_horner)
+
+
+def trigonometric_functions(value: float, frac_precision: int = 12) -> Mapping[str, Mapping[str, str]]:
     """Calculate trigonometric functions for a value (in radians).
     
+    Results for hashable arguments are cached, so the returned mappings are
+    read-only.
+    
     Args:
         value: Input value in radians
         frac_precision: Fractional precision for dozenal conversion
     
     Returns:
-        Dictionary of trigonometric function results in decimal and dozenal
+        Mapping of trigonometric function results in decimal and dozenal
     """
-    results = {
-        "sin": float(np.sin(value)),
-        "cos": float(np.cos(value)),
-        "tan": float(np.tan(value)),
-    }
+    try:
+        hash(value)
+        # 0.0 and -0.0 compare equal but sin/tan keep the sign of zero, so
+        # the sign is part of the cache key.
+        sign = math.copysign(1.0, value)
+    except TypeError:
+        return _trigonometric_functions(value, frac_precision)
+    return _trigonometric_functions_cached(sign, value, frac_precision)
+
+
+def _trigonometric_functions(value: float, frac_precision: int) -> Mapping[str, Mapping[str, str]]:
+    vals = np.array([np.sin(value), np.cos(value), np.tan(value)])
+    sin_doz, cos_doz, tan_doz = _array_to_dozenal(vals, frac_precision)
+    sin_val, cos_val, tan_val = vals.tolist()
     
-    return {
-        func: {
-            "decimal": str(val),
-            "dozenal": decimal_to_dozenal(val, frac_precision=frac_precision)
-        }
-        for func, val in results.items()
-    }
+    return MappingProxyType({
+        "sin": MappingProxyType({"decimal": str(sin_val), "dozenal": sin_doz}),
+        "cos": MappingProxyType({"decimal": str(cos_val), "dozenal": cos_doz}),
+        "tan": MappingProxyType({"decimal": str(tan_val), "dozenal": tan_doz}),
+    })
+
+
+@lru_cache(maxsize=256)
+def _trigonometric_functions_cached(sign: float, value: float, frac_precision: int) -> Mapping[str, Mapping[str, str]]:
+    return _trigonometric_functions(value, frac_precision)
 
 
 def linear_regression(x_values: List[float], y_values: List[float], frac_precision: int = 12) -> dict[str, dict[str, str]]:
@@ -83,33 +209,24 @@ def linear_regression(x_values: List[float], y_values: List[float], frac_precisi
     if len(x_values) != len(y_values):
         raise ValueError("x and y must have the same length")
     
-    x_arr = np.array(x_values)
-    y_arr = np.array(y_values)
+    x_arr = np.asarray(x_values, dtype=np.float64)
+    y_arr = np.asarray(y_values, dtype=np.float64)
     
-    # Calculate slope and intercept
-    coeffs = np.polyfit(x_arr, y_arr, 1)
-    slope = float(coeffs[0])
-    intercept = float(coeffs[1])
+    # Calculate slope and intercept (coefficients come back lowest degree first)
+    intercept, slope = (float(c) for c in np.polynomial.polynomial.polyfit(x_arr, y_arr, 1))
     
-    # Calculate R-squared
-    y_pred = slope * x_arr + intercept
-    ss_res = np.sum((y_arr - y_pred) ** 2)
-    ss_tot = np.sum((y_arr - np.mean(y_arr)) ** 2)
+    # Calculate R-squared; the sums of squares are dot products of the residuals
+    residuals = y_arr - (slope * x_arr + intercept)
+    ss_res = float(residuals @ residuals)
+    y_centered = y_arr - y_arr.mean()
+    ss_tot = float(y_centered @ y_centered)
     r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
     
+    values = (slope, intercept, r_squared)
+    dozenal = _array_to_dozenal(np.array(values), frac_precision)
     return {
-        "slope": {
-            "decimal": str(slope),
-            "dozenal": decimal_to_dozenal(slope, frac_precision=frac_precision)
-        },
-        "intercept": {
-            "decimal": str(intercept),
-            "dozenal": decimal_to_dozenal(intercept, frac_precision=frac_precision)
-        },
-        "r_squared": {
-            "decimal": str(r_squared),
-            "dozenal": decimal_to_dozenal(r_squared, frac_precision=frac_precision)
-        }
+        name: {"decimal": str(val), "dozenal": doz}
+        for name, val, doz in zip(("slope", "intercept", "r_squared"), values, dozenal)
     }
 
 
@@ -121,21 +238,25 @@ def eigenvalues(matrix: List[List[float]], frac_precision: int = 12) -> dict[str
         frac_precision: Fractional precision for dozenal conversion
     
     Returns:
-        Dictionary with eigenvalues and eigenvectors
+        Dictionary with eigenvalues
     """
     mat = np.array(matrix)
     
     if mat.shape[0] != mat.shape[1]:
         raise ValueError("Matrix must be square")
     
-    eigenvals, eigenvecs = np.linalg.eig(mat)
+    # Only the eigenvalues are reported, so skip the eigenvectors and use the
+    # cheaper symmetric solver (real results, ascending order) when possible.
+    # eigvalsh assumes a Hermitian matrix, so a complex symmetric one has to
+    # take the general path.
+    if np.isrealobj(mat) and np.array_equal(mat, mat.T):
+        real_parts = np.linalg.eigvalsh(mat)
+    else:
+        real_parts = np.real(np.linalg.eigvals(mat))
     
     return {
         "eigenvalues": [
-            {
-                "decimal": str(float(val.real)),
-                "dozenal": decimal_to_dozenal(float(val.real), frac_precision=frac_precision)
-            }
-            for val in eigenvals
+            {"decimal": str(val), "dozenal": doz}
+            for val, doz in zip(real_parts.tolist(), _array_to_dozenal(real_parts, frac_precision))
         ]
     }
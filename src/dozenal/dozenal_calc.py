@@ -1,132 +1,212 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from decimal import Decimal, getcontext
-from typing import Tuple
+import operator
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal, localcontext
+from functools import lru_cache
+from typing import Callable, Tuple
 
 from .dozenal_decimal_converter import (
-    _DOZENAL_DIGITS,
+    _ALLOWED_SET,
     decimal_to_dozenal,
     dozenal_to_decimal,
 )
 
 __all__ = ["CalculatorResult", "calculate"]
 
-_ALLOWED_DIGITS = set(_DOZENAL_DIGITS)
-_PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2}
+_ALLOWED_DIGITS = _ALLOWED_SET
+# Only the letter digits need case-folding; everything else passes through.
+_UPPER_DIGITS = str.maketrans({"t": "T", "e": "E"})
+
+# Token kinds. Token streams are kept as two parallel lists (kinds, values)
+# so the hot loops compare small ints instead of unpacking tagged tuples.
+_KIND_NUM, _KIND_OP, _KIND_LPAREN, _KIND_RPAREN = 0, 1, 2, 3
+
+# Operator precedence indexed by ord(op); 0 for anything that is not an operator.
+_prec = bytearray(128)
+_prec[ord("+")] = _prec[ord("-")] = 1
+_prec[ord("*")] = _prec[ord("/")] = 2
+_PREC_TABLE = bytes(_prec)
+del _prec
+
+# Tokenizer character classes, indexed by ord(ch) for ASCII input.
+(
+    _CLS_INVALID,
+    _CLS_SPACE,
+    _CLS_DIGIT,
+    _CLS_DOT,
+    _CLS_SIGN,
+    _CLS_OP,
+    _CLS_LPAREN,
+    _CLS_RPAREN,
+) = range(8)
+_CHAR_CLASS = bytearray(128)
+for _code in range(128):
+    if chr(_code).isspace():
+        _CHAR_CLASS[_code] = _CLS_SPACE
+for _ch in _ALLOWED_DIGITS:
+    _CHAR_CLASS[ord(_ch)] = _CLS_DIGIT
+_CHAR_CLASS[ord(".")] = _CLS_DOT
+_CHAR_CLASS[ord("+")] = _CHAR_CLASS[ord("-")] = _CLS_SIGN
+_CHAR_CLASS[ord("*")] = _CHAR_CLASS[ord("/")] = _CLS_OP
+_CHAR_CLASS[ord("(")] = _CLS_LPAREN
+_CHAR_CLASS[ord(")")] = _CLS_RPAREN
+del _code, _ch
+
+# Tokenizer actions, indexed by char_class * 2 + can_start_number.
+_ACT_ERROR, _ACT_SKIP, _ACT_NUMBER, _ACT_SIGNED_NUMBER, _ACT_OP, _ACT_LPAREN, _ACT_RPAREN = range(7)
+_ACTIONS = bytes(
+    [
+        _ACT_ERROR, _ACT_ERROR,  # invalid
+        _ACT_SKIP, _ACT_SKIP,  # whitespace
+        _ACT_NUMBER, _ACT_NUMBER,  # digit
+        _ACT_ERROR, _ACT_ERROR,  # '.' cannot start a token
+        _ACT_OP, _ACT_SIGNED_NUMBER,  # '+' / '-' is unary where a number may start
+        _ACT_OP, _ACT_OP,  # '*' / '/'
+        _ACT_LPAREN, _ACT_LPAREN,
+        _ACT_RPAREN, _ACT_RPAREN,
+    ]
+)
+
+_OPS: dict[str, Callable[[Decimal, Decimal], Decimal]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
 
-Token = Tuple[str, str]
-ConvertedToken = Tuple[str, Decimal | str]
+Tokens = Tuple[list[int], list[str]]
+ConvertedTokens = Tuple[list[int], list[Decimal | str]]
+Postfix = Tuple[tuple[int, ...], tuple[Decimal | str, ...]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalculatorResult:
     decimal: Decimal
-    dozenal: str
+    frac_precision: int = 12
+    _dozenal: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def dozenal(self) -> str:
+        """Dozenal form of `decimal`, formatted on first access and then cached."""
+        if self._dozenal is None:
+            value = decimal_to_dozenal(self.decimal, frac_precision=self.frac_precision)
+            object.__setattr__(self, "_dozenal", value)
+            return value
+        return self._dozenal
 
 
 def calculate(expression: str, frac_precision: int = 12) -> CalculatorResult:
     """Evaluate a dozenal expression and return decimal + dozenal output."""
-    expr = expression.strip().upper()
+    expr = expression.strip().translate(_UPPER_DIGITS)
     if not expr:
         raise ValueError("expression is empty")
     if frac_precision < 0:
         raise ValueError("frac_precision must be non-negative")
 
-    getcontext().prec = max(28, frac_precision * 3)
-    tokens = _convert_numbers(_tokenize(expr))
-    postfix = _to_postfix(tokens)
-    result = _evaluate_postfix(postfix)
-    dozenal_value = decimal_to_dozenal(result, frac_precision=frac_precision)
-    return CalculatorResult(decimal=result, dozenal=dozenal_value)
+    precision = max(28, frac_precision * 3)
+    postfix = _compile(expr, precision)
+    with localcontext() as ctx:
+        ctx.prec = precision
+        result = _evaluate_postfix(*postfix)
+    return CalculatorResult(decimal=result, frac_precision=frac_precision)
+
 
+@lru_cache(maxsize=256)
+def _compile(expression: str, precision: int) -> Postfix:
+    """Tokenize an expression, convert its literals and reorder it to postfix.
 
-def _tokenize(expression: str) -> list[Token]:
-    tokens: list[Token] = []
+    Cached on the normalized expression and the Decimal precision the
+    literals are converted under, so repeated expressions only pay for
+    evaluation.
+    """
+    with localcontext() as ctx:
+        ctx.prec = precision
+        kinds, values = _tokenize(expression)
+        out_kinds, out_values = _to_postfix(kinds, _convert_numbers(kinds, values))
+    return tuple(out_kinds), tuple(out_values)
+
+
+def _tokenize(expression: str) -> Tokens:
+    kinds: list[int] = []
+    values: list[str] = []
     i = 0
-    can_start_number = True
+    can_start_number = 1
     length = len(expression)
 
     while i < length:
         ch = expression[i]
-        if ch.isspace():
+        code = ord(ch)
+        if code < 128:
+            char_class = _CHAR_CLASS[code]
+        else:
+            char_class = _CLS_SPACE if ch.isspace() else _CLS_INVALID
+        action = _ACTIONS[char_class * 2 + can_start_number]
+
+        if action == _ACT_SKIP:
             i += 1
             continue
 
-        if ch in "+-" and can_start_number:
-            next_char = expression[i + 1] if i + 1 < length else ""
-            if next_char == "(":
-                tokens.append(("number", "0"))
-                tokens.append(("operator", ch))
+        if action == _ACT_NUMBER or action == _ACT_SIGNED_NUMBER:
+            start = i
+            if action == _ACT_SIGNED_NUMBER:
+                if i + 1 < length and expression[i + 1] == "(":
+                    kinds += (_KIND_NUM, _KIND_OP)
+                    values += ("0", ch)
+                    i += 1
+                    continue
                 i += 1
-                can_start_number = True
-                continue
-            token, i = _parse_number(expression, i)
-            tokens.append(("number", token))
-            can_start_number = False
-            continue
 
-        if ch in "+-*/":
-            tokens.append(("operator", ch))
-            i += 1
-            can_start_number = True
+            digits_start = i
+            while i < length and expression[i] in _ALLOWED_DIGITS:
+                i += 1
+            digits_seen = i > digits_start
+            if i < length and expression[i] == ".":
+                i += 1
+                digits_start = i
+                while i < length and expression[i] in _ALLOWED_DIGITS:
+                    i += 1
+                digits_seen = digits_seen or i > digits_start
+            if not digits_seen:
+                raise ValueError("invalid dozenal number in expression")
+
+            kinds.append(_KIND_NUM)
+            values.append(expression[start:i])
+            can_start_number = 0
             continue
 
-        if ch == "(":
-            tokens.append(("lparen", ch))
+        if action == _ACT_OP:
+            kinds.append(_KIND_OP)
+            values.append(ch)
             i += 1
-            can_start_number = True
+            can_start_number = 1
             continue
 
-        if ch == ")":
-            tokens.append(("rparen", ch))
+        if action == _ACT_LPAREN:
+            kinds.append(_KIND_LPAREN)
+            values.append(ch)
             i += 1
-            can_start_number = False
+            can_start_number = 1
             continue
 
-        if ch in _ALLOWED_DIGITS:
-            token, i = _parse_number(expression, i)
-            tokens.append(("number", token))
-            can_start_number = False
+        if action == _ACT_RPAREN:
+            kinds.append(_KIND_RPAREN)
+            values.append(ch)
+            i += 1
+            can_start_number = 0
             continue
 
         raise ValueError(f"unexpected character {ch!r} in expression")
 
-    return tokens
-
-
-def _parse_number(expression: str, start: int) -> Tuple[str, int]:
-    i = start
-    if expression[i] in "+-":
-        i += 1
-    digits_seen = False
-
-    while i < len(expression) and expression[i] in _ALLOWED_DIGITS:
-        digits_seen = True
-        i += 1
-
-    if i < len(expression) and expression[i] == ".":
-        i += 1
-        fractional_seen = False
-        while i < len(expression) and expression[i] in _ALLOWED_DIGITS:
-            fractional_seen = True
-            i += 1
-        digits_seen = digits_seen or fractional_seen
-
-    if not digits_seen:
-        raise ValueError("invalid dozenal number in expression")
-
-    return expression[start:i], i
+    return kinds, values
 
 
-def _convert_numbers(tokens: list[Token]) -> list[ConvertedToken]:
-    converted: list[ConvertedToken] = []
-    for kind, value in tokens:
-        if kind == "number":
-            converted.append(("number", _dozenal_number_to_decimal(value)))
-        else:
-            converted.append((kind, value))
-    return converted
+def _convert_numbers(kinds: list[int], values: list[str]) -> list[Decimal | str]:
+    return [
+        _dozenal_number_to_decimal(value) if kind == _KIND_NUM else value
+        for kind, value in zip(kinds, values)
+    ]
 
 
 def _dozenal_number_to_decimal(value: str) -> Decimal:
@@ -138,78 +218,85 @@ def _dozenal_number_to_decimal(value: str) -> Decimal:
     return Decimal(raw)
 
 
-def _to_postfix(tokens: list[ConvertedToken]) -> list[ConvertedToken]:
-    output: list[ConvertedToken] = []
-    operators: list[Tuple[str, str]] = []
+def _to_postfix(kinds: list[int], values: list[Decimal | str]) -> ConvertedTokens:
+    out_kinds: list[int] = []
+    out_values: list[Decimal | str] = []
+    op_kinds: list[int] = []
+    op_values: list[str] = []
 
-    for kind, value in tokens:
-        if kind == "number":
-            output.append((kind, value))
+    for kind, value in zip(kinds, values):
+        if kind == _KIND_NUM:
+            out_kinds.append(kind)
+            out_values.append(value)
             continue
 
-        if kind == "operator":
-            assert isinstance(value, str)
-            while operators and operators[-1][0] == "operator":
-                top = operators[-1][1]
-                if _PRECEDENCE[top] >= _PRECEDENCE[value]:
-                    output.append(operators.pop())
+        assert isinstance(value, str)
+        if kind == _KIND_OP:
+            precedence = _PREC_TABLE[ord(value)]
+            while op_kinds and op_kinds[-1] == _KIND_OP:
+                if _PREC_TABLE[ord(op_values[-1])] >= precedence:
+                    out_kinds.append(op_kinds.pop())
+                    out_values.append(op_values.pop())
                     continue
                 break
-            operators.append((kind, value))
+            op_kinds.append(kind)
+            op_values.append(value)
             continue
 
-        if kind == "lparen":
-            assert isinstance(value, str)
-            operators.append((kind, value))
+        if kind == _KIND_LPAREN:
+            op_kinds.append(kind)
+            op_values.append(value)
             continue
 
-        if kind == "rparen":
-            while operators and operators[-1][0] != "lparen":
-                output.append(operators.pop())
-            if not operators:
+        if kind == _KIND_RPAREN:
+            while op_kinds and op_kinds[-1] != _KIND_LPAREN:
+                out_kinds.append(op_kinds.pop())
+                out_values.append(op_values.pop())
+            if not op_kinds:
                 raise ValueError("mismatched parentheses")
-            operators.pop()
+            op_kinds.pop()
+            op_values.pop()
             continue
 
         raise ValueError(f"unexpected token kind {kind!r}")
 
-    while operators:
-        kind, value = operators.pop()
-        if kind in ("lparen", "rparen"):
+    while op_kinds:
+        kind = op_kinds.pop()
+        value = op_values.pop()
+        if kind in (_KIND_LPAREN, _KIND_RPAREN):
             raise ValueError("mismatched parentheses")
-        output.append((kind, value))
+        out_kinds.append(kind)
+        out_values.append(value)
 
-    return output
+    return out_kinds, out_values
 
 
-def _evaluate_postfix(postfix: list[ConvertedToken]) -> Decimal:
-    stack: list[Decimal] = []
+def _evaluate_postfix(kinds: Sequence[int], values: Sequence[Decimal | str]) -> Decimal:
+    # The stack can never hold more entries than there are tokens, so it is
+    # allocated once and addressed through `top` instead of append/pop.
+    stack: list[Decimal | None] = [None] * len(kinds)
+    top = 0
 
-    for kind, value in postfix:
-        if kind == "number":
+    for kind, value in zip(kinds, values):
+        if kind == _KIND_NUM:
             assert isinstance(value, Decimal)
-            stack.append(value)
+            stack[top] = value
+            top += 1
             continue
 
-        if len(stack) < 2:
+        if top < 2:
             raise ValueError("incomplete expression")
 
-        right = stack.pop()
-        left = stack.pop()
-
         assert isinstance(value, str)
-        if value == "+":
-            stack.append(left + right)
-        elif value == "-":
-            stack.append(left - right)
-        elif value == "*":
-            stack.append(left * right)
-        elif value == "/":
-            stack.append(left / right)
-        else:
+        op = _OPS.get(value)
+        if op is None:
             raise ValueError(f"unsupported operator {value!r}")
+        top -= 1
+        stack[top - 1] = op(stack[top - 1], stack[top])
 
-    if len(stack) != 1:
+    if top != 1:
         raise ValueError("expression did not reduce to single value")
 
-    return stack[0]
+    result = stack[0]
+    assert result is not None
+    return result
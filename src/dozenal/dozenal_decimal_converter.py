@@ -21,8 +21,10 @@ Example:
 
 from __future__ import annotations
 
-from decimal import Decimal, getcontext
+import math
+from decimal import ROUND_FLOOR, Decimal, localcontext
 from fractions import Fraction
+from functools import lru_cache
 from typing import Union
 
 __all__ = [
@@ -31,20 +33,86 @@ __all__ = [
 ]
 
 _DOZENAL_DIGITS = "0123456789TE"
+_DIGIT_VALUE: dict[str, int] = {ch: i for i, ch in enumerate(_DOZENAL_DIGITS)}
+_ALLOWED_SET = frozenset(_DOZENAL_DIGITS)
+# Three-digit groups for 0..12**3-1, so one divmod by 1728 emits three digits.
+_DIGIT_TRIPLES: list[str] = [
+	a + b + c for a in _DOZENAL_DIGITS for b in _DOZENAL_DIGITS for c in _DOZENAL_DIGITS
+]
+# Integers longer than this many bits (~280 dozenal digits) are converted by
+# recursive splitting, which beats the digit loop from there on.
+_SPLIT_MIN_BITS = 1000
+_BITS_PER_DIGIT = math.log2(12)
 
 
 def _int_to_base12(n: int) -> str:
 	"""Convert a non-negative integer to base-12 digits as a string.
 
 	Uses the characters in _DOZENAL_DIGITS with 'T' for 10 and 'E' for 11.
+	Digits are produced three at a time from _DIGIT_TRIPLES; very large
+	values are first split into halves by _int_to_base12_split.
+	"""
+	if n.bit_length() > _SPLIT_MIN_BITS:
+		return _int_to_base12_split(n, 0)
+	if n < 1728:
+		return _DIGIT_TRIPLES[n].lstrip("0") or "0"
+	groups: list[str] = []
+	while n >= 1728:
+		n, rem = divmod(n, 1728)
+		groups.append(_DIGIT_TRIPLES[rem])
+	groups.append(_DIGIT_TRIPLES[n].lstrip("0"))
+	return "".join(reversed(groups))
+
+
+@lru_cache(maxsize=64)
+def _pow12(e: int) -> int:
+	"""Return 12**e, building large powers by squaring cached smaller ones."""
+	if e <= 64:
+		return 12**e
+	half = _pow12(e // 2)
+	return half * half * 12 if e & 1 else half * half
+
+
+@lru_cache(maxsize=32)
+def _frac_scale(frac_precision: int) -> Decimal:
+	"""Return Decimal(12**frac_precision), the fixed-point scale for fractions."""
+	return Decimal(_pow12(frac_precision))
+
+
+@lru_cache(maxsize=None)
+def _pow12_rung(k: int) -> int:
+	"""Return 12**(2**k), each rung the square of the one below.
+
+	The ladder only grows as large as the biggest number converted so far
+	(about log2 of its digit count), so it is built lazily rather than up
+	front.
+	"""
+	if k == 0:
+		return 12
+	below = _pow12_rung(k - 1)
+	return below * below
+
+
+def _int_to_base12_split(n: int, width: int) -> str:
+	"""Divide-and-conquer base-12 conversion for large non-negative integers.
+
+	Splits n = hi * 12**m + lo where m = 2**k is the largest power of two with
+	12**m <= n, and converts both halves recursively, so the expensive big-int
+	divisions shrink at each level instead of peeling off one small remainder
+	at a time. Every split reuses a rung of the same power ladder. `width`
+	zero-pads the result; 0 means no padding.
 	"""
-	if n == 0:
-		return "0"
-	digits: list[str] = []
-	while n > 0:
-		n, rem = divmod(n, 12)
-		digits.append(_DOZENAL_DIGITS[rem])
-	return "".join(reversed(digits))
+	if n.bit_length() <= _SPLIT_MIN_BITS:
+		digits = _int_to_base12(n)
+		return digits.rjust(width, "0") if width else digits
+	k = int(n.bit_length() / _BITS_PER_DIGIT).bit_length() - 1
+	while _pow12_rung(k) > n:
+		k -= 1
+	while _pow12_rung(k + 1) <= n:
+		k += 1
+	m = 1 << k
+	hi, lo = divmod(n, _pow12_rung(k))
+	return _int_to_base12_split(hi, width - m if width else 0) + _int_to_base12_split(lo, m)
 
 
 def _int_from_base12(s: str) -> int:
@@ -53,18 +121,36 @@ def _int_from_base12(s: str) -> int:
 	Raises ValueError for invalid digits.
 	"""
 	total: int = 0
-	for ch in s:
-		if ch not in _DOZENAL_DIGITS:
-			raise ValueError(f"invalid dozenal digit: {ch!r}")
-		total = total * 12 + _DOZENAL_DIGITS.index(ch)
+	try:
+		for ch in s:
+			total = total * 12 + _DIGIT_VALUE[ch]
+	except KeyError as exc:
+		raise ValueError(f"invalid dozenal digit: {exc.args[0]!r}") from None
 	return total
 
 
-def decimal_to_dozenal(value: Union[int, float, Decimal], frac_precision: int = 12) -> str:
+@lru_cache(maxsize=4096)
+def _float_to_limited_fraction(value: float) -> tuple[int, int]:
+	"""Return (numerator, denominator) of the nearest fraction with denominator <= 10**9.
+
+	Cached because bulk callers convert the same floats (0.0, 1.0, ...) many
+	times. 0.0 and -0.0 share an entry, which is fine since both map to 0/1;
+	NaN and infinities raise from Fraction and are never cached.
+	"""
+	frac = Fraction(value).limit_denominator(10**9)
+	return frac.numerator, frac.denominator
+
+
+def decimal_to_dozenal(
+	value: Union[int, float, Decimal], frac_precision: int = 12, *, simplify: bool = True
+) -> str:
 	"""Convert a decimal value (int, float, Decimal) to a dozenal string.
 
 	- For integers: returns a dozenal integer string with optional leading '-' for negatives.
 	- For floats and Decimal: returns decimal with fractional base-12 digits up to `frac_precision`.
+	- For floats, `simplify` (the default) snaps the value to the nearest fraction with
+	  denominator <= 10**9 first, so 1/12 gives '0.1'. Pass simplify=False to convert
+	  the exact IEEE-754 value instead, which is cheaper for arbitrary computed floats.
 
 	Note: For fractional conversion, Decimal is used for precision.
 	"""
@@ -72,34 +158,47 @@ def decimal_to_dozenal(value: Union[int, float, Decimal], frac_precision: int =
 		sign: str = "-" if value < 0 else ""
 		return sign + _int_to_base12(abs(value))
 
-	# For floats, attempt to convert to an exact rational using Fraction
-	# so simple fractions like 1/12 yield exact dozenal results.
-	if isinstance(value, float):
-		frac: Fraction = Fraction(value).limit_denominator(10**9)
-		getcontext().prec = max(28, frac_precision * 3)
-		dec: Decimal = Decimal(frac.numerator) / Decimal(frac.denominator)
-	else:
-		# For Decimal, use it directly; set precision relative to frac_precision
-		getcontext().prec = max(28, frac_precision * 3)
-		dec = Decimal(value)
-	sign = "-" if dec < 0 else ""
-	dec = abs(dec)
-	integer_part = int(dec // 1)
-	frac_part: Decimal = dec - integer_part
-	integer_digits: str = _int_to_base12(integer_part)
-	if frac_precision <= 0 or frac_part == 0:
-		return sign + integer_digits
-
-	# Convert fractional part to base-12: multiply frac by 12 repeatedly
-	digits: list[str] = []
-	for _ in range(frac_precision):
-		frac_part *= 12
-		digit = int(frac_part // 1)
-		digits.append(_DOZENAL_DIGITS[digit])
-		frac_part -= digit
-		if frac_part == 0:
-			break
-	return sign + integer_digits + "." + "".join(digits)
+	with localcontext() as ctx:
+		ctx.prec = max(28, frac_precision * 3)
+		# For floats, attempt to convert to an exact rational using Fraction
+		# so simple fractions like 1/12 yield exact dozenal results. Floats
+		# whose exact ratio already has a small denominator (0.5, 17.0, ...)
+		# are left alone by limit_denominator, so skip it for those.
+		if isinstance(value, float):
+			if not simplify:
+				dec: Decimal = +Decimal.from_float(value)
+			else:
+				numerator, denominator = value.as_integer_ratio()
+				if denominator > 10**9:
+					numerator, denominator = _float_to_limited_fraction(value)
+				dec = Decimal(numerator) / Decimal(denominator)
+		else:
+			dec = Decimal(value)
+		sign = "-" if dec.is_signed() and dec else ""
+		integer_dec, frac_part = divmod(dec.copy_abs(), 1)
+		integer_part = int(integer_dec)
+		if frac_precision <= 0 or frac_part == 0:
+			# A value that truncates to zero is printed unsigned, not "-0".
+			return (sign if integer_part else "") + _int_to_base12(integer_part)
+
+		# Convert fractional part to base-12: scale by 12**frac_precision once,
+		# truncate, then read the digits off the resulting integer. The product
+		# is rounded two digits short of the working precision so a value that
+		# fell just below an exact dozenal fraction when it was computed
+		# (e.g. 1/3 or 23/24) still gives that fraction instead of a run of E's.
+		ctx.prec -= 2
+		scale = _frac_scale(frac_precision)
+		scaled = int((frac_part * scale).to_integral_value(rounding=ROUND_FLOOR))
+		# That rounding can lift a fraction like 0.999... all the way to the
+		# scale; carry it into the integer part rather than dropping it.
+		if scaled >= scale:
+			integer_part += 1
+			scaled -= int(scale)
+	integer_digits = _int_to_base12(integer_part)
+	digits = _int_to_base12(scaled).rjust(frac_precision, "0").rstrip("0")
+	if not digits:
+		return (sign if integer_part else "") + integer_digits
+	return sign + integer_digits + "." + digits
 
 
 def dozenal_to_decimal(s: object) -> Union[int, float, Decimal]:
@@ -126,15 +225,13 @@ def dozenal_to_decimal(s: object) -> Union[int, float, Decimal]:
 		return sign * integer_value
 
 	frac_str = parts[1]
-	# Fractional conversion: sum digit*(12**-i) for i from 1
-	frac_total = Decimal(0)
-	power = Decimal(1)
-	for ch in frac_str:
-		if ch not in _DOZENAL_DIGITS:
-			raise ValueError(f"invalid dozenal digit: {ch!r}")
-		power *= Decimal(12)
-		frac_total += Decimal(_DOZENAL_DIGITS.index(ch)) / power
-	return sign * (Decimal(integer_value) + frac_total)
+	# Fractional conversion: read the digits as one integer numerator
+	# (Horner's method) and divide by 12**len(frac_str) once at the end.
+	numerator = _int_from_base12(frac_str)
+	denominator = 12 ** len(frac_str)
+	with localcontext() as ctx:
+		ctx.prec = max(ctx.prec, 2 * (len(int_str) + len(frac_str)))
+		return sign * (Decimal(integer_value) + Decimal(numerator) / Decimal(denominator))
 
 
 if __name__ == "__main__":
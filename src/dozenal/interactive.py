@@ -9,9 +9,14 @@ Provides a user-friendly interface for exploring dozenal math with:
 
 from __future__ import annotations
 
+import io
+import math
 import sys
+import warnings
+from contextlib import contextmanager
 from decimal import Decimal
-from typing import Callable
+from functools import lru_cache
+from typing import Callable, Iterator
 
 import numpy as np
 
@@ -21,6 +26,82 @@ from .dozenal_decimal_converter import decimal_to_dozenal, dozenal_to_decimal
 
 __all__ = ["run_interactive"]
 
+_DIGIT_BYTES = b"0123456789TE"
+_SMALL_LIMIT = 12 ** 16
+
+
+def _int_to_dozenal_small(n: int) -> str:
+    """Convert an integer to dozenal without going through Decimal.
+
+    Digits are written right-to-left into a fixed 16-byte buffer; values
+    too wide for it are handed to :func:`decimal_to_dozenal`.
+    """
+    if n == 0:
+        return "0"
+    neg = n < 0
+    if neg:
+        n = -n
+    if n >= _SMALL_LIMIT:
+        return decimal_to_dozenal(-n if neg else n)
+    buf = bytearray(16)
+    i = 16
+    while n:
+        n, r = divmod(n, 12)
+        i -= 1
+        buf[i] = _DIGIT_BYTES[r]
+    s = buf[i:].decode("ascii")
+    return "-" + s if neg else s
+
+
+# Memoized converter for the small integers the table/sequence/compare
+# helpers format over and over.
+_doz = lru_cache(maxsize=512)(_int_to_dozenal_small)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _doz_memo(value, frac_precision: int) -> str:
+    return decimal_to_dozenal(value, frac_precision=frac_precision)
+
+
+def _doz_cached(value, frac_precision: int = 12) -> str:
+    """Memoized :func:`decimal_to_dozenal` for the REPL's float/Decimal output.
+
+    Results are keyed by type as well as value so that ``1``, ``1.0`` and
+    ``Decimal("1")`` stay distinct; unhashable inputs skip the cache.
+    """
+    try:
+        return _doz_memo(value, frac_precision)
+    except TypeError:
+        return decimal_to_dozenal(value, frac_precision=frac_precision)
+
+
+# Dozenal products for the 12x12 multiplication table, built once.
+_PRODUCTS: list[list[str]] = [[_doz(i * j) for j in range(1, 13)] for i in range(1, 13)]
+
+# The rendered table never changes, so lay out its text once as well.
+_TABLE_SEP = "-" * 70
+_TABLE_HEADER = "   |" + "".join(_doz(i).rjust(5) for i in range(1, 13))
+_TABLE_BODY = "\n".join(
+    [_TABLE_HEADER, _TABLE_SEP]
+    + [_doz(i).rjust(3) + "|" + "".join(doz.rjust(5) for doz in row) for i, row in enumerate(_PRODUCTS, 1)]
+) + "\n\n"
+
+_DIGIT_CHARS = np.array(list("0123456789TE"))
+
+
+@contextmanager
+def _buffered_out() -> Iterator[Callable[[str], int]]:
+    """Collect a handler's output and hand it to stdout in one write.
+
+    Yields the buffer's ``write``; whatever was written is flushed when the
+    block exits, even if it exits with an exception.
+    """
+    buf = io.StringIO()
+    try:
+        yield buf.write
+    finally:
+        sys.stdout.write(buf.getvalue())
+
 
 def _print_banner() -> None:
     """Display welcome banner."""
@@ -63,7 +144,7 @@ def _handle_convert(frac_precision: int = 12) -> None:
                 value = Decimal(value_str)
             else:
                 value = int(value_str)
-            result = decimal_to_dozenal(value, frac_precision=frac_precision)
+            result = _doz_cached(value, frac_precision=frac_precision)
             print(f"Decimal {value} = Dozenal {result}")
         except Exception as e:
             print(f"Error: {e}")
@@ -94,32 +175,45 @@ def _handle_calc(frac_precision: int = 12) -> None:
         print(f"Error: {e}")
 
 
-def _handle_table() -> None:
+def _handle_table(frac_precision: int = 12) -> None:
     """Display multiplication table in dozenal."""
-    print("\nDozenal Multiplication Table (1-12)")
-    print("-" * 70)
-    
-    # Header
-    print("   |", end="")
-    for i in range(1, 13):
-        doz = decimal_to_dozenal(i)
-        print(f"{doz:>5}", end="")
-    print()
-    print("-" * 70)
-    
-    # Rows
-    for i in range(1, 13):
-        doz_i = decimal_to_dozenal(i)
-        print(f"{doz_i:>3}|", end="")
-        for j in range(1, 13):
-            product = i * j
-            doz_product = decimal_to_dozenal(product)
-            print(f"{doz_product:>5}", end="")
-        print()
-    print()
+    with _buffered_out() as write:
+        write("\nDozenal Multiplication Table (1-12)\n")
+        write(_TABLE_SEP + "\n")
+        write(_TABLE_BODY)
 
 
-def _handle_sequence() -> None:
+def _dozenal_array(values) -> list[str]:
+    """Convert a batch of integers to dozenal strings with NumPy.
+
+    Digits are peeled off the whole array at once with ``divmod`` and the
+    resulting character columns are viewed back as fixed-width strings.
+    Values that do not fit in int64 fall back to the scalar converter.
+    """
+    try:
+        q = np.asarray(values, dtype=np.int64)
+    except OverflowError:
+        return [_doz(int(v)) for v in values]
+    if q.size == 0:
+        return []
+    q = q.ravel()
+    negative = (q < 0).tolist()
+    q = np.abs(q)
+    columns = []
+    while True:
+        q, r = np.divmod(q, 12)
+        columns.append(_DIGIT_CHARS[r])
+        if not q.any():
+            break
+    digits = np.stack(columns[::-1], axis=1)
+    strings = digits.view(f"U{len(columns)}").ravel().tolist()
+    return [
+        ("-" if neg else "") + (s.lstrip("0") or "0")
+        for s, neg in zip(strings, negative)
+    ]
+
+
+def _handle_sequence(frac_precision: int = 12) -> None:
     """Generate and display number sequences."""
     print("\nSequence Generator")
     print("Available sequences:")
@@ -136,34 +230,29 @@ def _handle_sequence() -> None:
         print("Invalid number.")
         return
     
-    print("\nDecimal | Dozenal")
-    print("-" * 25)
-    
-    if choice == "1":
-        for i in range(1, count + 1):
-            doz = decimal_to_dozenal(i)
-            print(f"{i:7} | {doz}")
-    elif choice == "2":
-        for i in range(count):
-            value = 12 ** i
-            doz = decimal_to_dozenal(value)
-            print(f"{value:7} | {doz}")
-    elif choice == "3":
-        for i in range(1, count + 1):
-            value = i * i
-            doz = decimal_to_dozenal(value)
-            print(f"{value:7} | {doz}")
-    elif choice == "4":
-        for i in range(1, count + 1):
-            value = i * i * i
-            doz = decimal_to_dozenal(value)
-            print(f"{value:7} | {doz}")
-    else:
-        print("Invalid choice.")
-    print()
+    with _buffered_out() as write:
+        write("\nDecimal | Dozenal\n")
+        write("-" * 25 + "\n")
+        
+        if choice == "1":
+            values = np.arange(1, count + 1, dtype=np.int64).tolist()
+        elif choice == "2":
+            # Python ints: 12**18 and up no longer fit in int64.
+            values = [12 ** i for i in range(count)]
+        elif choice == "3":
+            values = (np.arange(1, count + 1, dtype=np.int64) ** 2).tolist()
+        elif choice == "4":
+            values = (np.arange(1, count + 1, dtype=np.int64) ** 3).tolist()
+        else:
+            write("Invalid choice.\n\n")
+            return
+        
+        for value, doz in zip(values, _dozenal_array(values)):
+            write(str(value).rjust(7) + " | " + doz + "\n")
+        write("\n")
 
 
-def _handle_compare() -> None:
+def _handle_compare(frac_precision: int = 12) -> None:
     """Compare number representations across bases."""
     print("\nBase Comparison")
     value_str = input("Enter a decimal number: ").strip()
@@ -173,13 +262,31 @@ def _handle_compare() -> None:
         print("Invalid number.")
         return
     
-    print(f"\nRepresentations of {value}:")
-    print(f"  Binary (base-2):  {bin(value)}")
-    print(f"  Octal (base-8):   {oct(value)}")
-    print(f"  Decimal (base-10): {value}")
-    print(f"  Dozenal (base-12): {decimal_to_dozenal(value)}")
-    print(f"  Hex (base-16):    {hex(value)}")
-    print()
+    sys.stdout.write(
+        f"\nRepresentations of {value}:\n"
+        f"  Binary (base-2):  {value:#b}\n"
+        f"  Octal (base-8):   {value:#o}\n"
+        f"  Decimal (base-10): {value}\n"
+        f"  Dozenal (base-12): {_int_to_dozenal_small(value)}\n"
+        f"  Hex (base-16):    {value:#x}\n"
+        "\n"
+    )
+
+
+# Scratch buffers for the 2x2 matrix command; every entry is overwritten
+# before use, so the REPL never allocates fresh input matrices.
+_MAT1 = np.empty((2, 2))
+_MAT2 = np.empty((2, 2))
+_MAT_OUT = np.empty((2, 2))
+
+
+def _read_matrix_2x2(buf: np.ndarray) -> np.ndarray:
+    """Prompt for the four entries of a 2x2 matrix and store them in *buf*."""
+    buf[0, 0] = float(input("  [0,0]: "))
+    buf[0, 1] = float(input("  [0,1]: "))
+    buf[1, 0] = float(input("  [1,0]: "))
+    buf[1, 1] = float(input("  [1,1]: "))
+    return buf
 
 
 def _handle_matrix(frac_precision: int = 12) -> None:
@@ -196,40 +303,28 @@ def _handle_matrix(frac_precision: int = 12) -> None:
     try:
         if choice in ["1", "2"]:
             print("\nEnter first 2x2 matrix (decimal values):")
-            a11 = float(input("  [0,0]: "))
-            a12 = float(input("  [0,1]: "))
-            a21 = float(input("  [1,0]: "))
-            a22 = float(input("  [1,1]: "))
-            mat1 = np.array([[a11, a12], [a21, a22]])
+            mat1 = _read_matrix_2x2(_MAT1)
             
             print("\nEnter second 2x2 matrix (decimal values):")
-            b11 = float(input("  [0,0]: "))
-            b12 = float(input("  [0,1]: "))
-            b21 = float(input("  [1,0]: "))
-            b22 = float(input("  [1,1]: "))
-            mat2 = np.array([[b11, b12], [b21, b22]])
+            mat2 = _read_matrix_2x2(_MAT2)
             
             if choice == "1":
-                result = mat1 + mat2
+                result = np.add(mat1, mat2, out=_MAT_OUT)
                 print("\nResult (addition):")
             else:
-                result = mat1 @ mat2
+                result = np.matmul(mat1, mat2, out=_MAT_OUT)
                 print("\nResult (multiplication):")
             
             _print_matrix_dozenal(result, frac_precision)
             
         elif choice in ["3", "4"]:
             print("\nEnter 2x2 matrix (decimal values):")
-            a11 = float(input("  [0,0]: "))
-            a12 = float(input("  [0,1]: "))
-            a21 = float(input("  [1,0]: "))
-            a22 = float(input("  [1,1]: "))
-            mat = np.array([[a11, a12], [a21, a22]])
+            mat = _read_matrix_2x2(_MAT1)
             
             if choice == "3":
                 det = np.linalg.det(mat)
                 print(f"\nDeterminant (decimal): {det}")
-                print(f"Determinant (dozenal): {decimal_to_dozenal(det, frac_precision=frac_precision)}")
+                print(f"Determinant (dozenal): {_doz_cached(det, frac_precision=frac_precision)}")
             else:
                 inv = np.linalg.inv(mat)
                 print("\nInverse matrix:")
@@ -243,56 +338,61 @@ def _handle_matrix(frac_precision: int = 12) -> None:
 
 def _print_matrix_dozenal(matrix: np.ndarray, frac_precision: int) -> None:
     """Print a matrix with both decimal and dozenal representations."""
-    print("Decimal:")
-    for row in matrix:
-        print("  [", end="")
-        for i, val in enumerate(row):
-            if i > 0:
-                print(", ", end="")
-            print(f"{val:8.4f}", end="")
-        print("]")
-    
-    print("Dozenal:")
-    for row in matrix:
-        print("  [", end="")
-        for i, val in enumerate(row):
-            if i > 0:
-                print(", ", end="")
-            doz = decimal_to_dozenal(float(val), frac_precision=frac_precision)
-            print(f"{doz:>12}", end="")
-        print("]")
+    with _buffered_out() as write:
+        write("Decimal:\n")
+        for row in matrix:
+            write("  [" + ", ".join(f"{val:8.4f}" for val in row) + "]\n")
+        
+        write("Dozenal:\n")
+        for row in matrix:
+            dozs = (_doz_cached(float(val), frac_precision=frac_precision) for val in row)
+            write("  [" + ", ".join(doz.rjust(12) for doz in dozs) + "]\n")
+
+
+def _parse_float_list(text: str) -> np.ndarray:
+    """Parse whitespace-separated decimal numbers into a float64 array."""
+    if not text or text.isspace():
+        # np.fromstring reads whitespace-only text as [-1.0].
+        return np.empty(0, dtype=np.float64)
+    with warnings.catch_warnings():
+        # Older NumPy releases only warn (and truncate) on unparsable input.
+        warnings.simplefilter("error", DeprecationWarning)
+        return np.fromstring(text, dtype=np.float64, sep=" ")
 
 
 def _handle_stats(frac_precision: int = 12) -> None:
     """Handle statistical operations using NumPy."""
     print("\nStatistical Operations (NumPy powered)")
     print("Enter numbers separated by spaces (decimal):")
-    values_str = input("Numbers: ").strip()
-    
-    if not values_str:
-        print("No values entered.")
-        return
+    values_str = input("Numbers: ")
     
     try:
-        values = [float(x) for x in values_str.split()]
-        arr = np.array(values)
+        arr = _parse_float_list(values_str)
+        n = arr.size
+        if n == 0:
+            print("No values entered.")
+            return
         
+        # One sum feeds both Sum and Mean; the variance uses the centered
+        # dot product rather than E[x^2] - E[x]^2 to avoid cancellation.
         # Convert numpy types to native Python types for decimal_to_dozenal
-        mean_val = float(np.mean(arr))
+        sum_val = float(arr.sum())
+        mean_val = sum_val / n
+        centered = arr - mean_val
+        std_val = math.sqrt(float(np.dot(centered, centered)) / n)
+        min_val = float(arr.min())
+        max_val = float(arr.max())
         median_val = float(np.median(arr))
-        std_val = float(np.std(arr))
-        min_val = float(np.min(arr))
-        max_val = float(np.max(arr))
-        sum_val = float(np.sum(arr))
         
-        print("\nStatistics:")
-        print(f"  Count:      {len(values)}")
-        print(f"  Sum:        {sum_val} (decimal) = {decimal_to_dozenal(sum_val, frac_precision=frac_precision)} (dozenal)")
-        print(f"  Mean:       {mean_val} (decimal) = {decimal_to_dozenal(mean_val, frac_precision=frac_precision)} (dozenal)")
-        print(f"  Median:     {median_val} (decimal) = {decimal_to_dozenal(median_val, frac_precision=frac_precision)} (dozenal)")
-        print(f"  Std Dev:    {std_val} (decimal) = {decimal_to_dozenal(std_val, frac_precision=frac_precision)} (dozenal)")
-        print(f"  Min:        {min_val} (decimal) = {decimal_to_dozenal(min_val, frac_precision=frac_precision)} (dozenal)")
-        print(f"  Max:        {max_val} (decimal) = {decimal_to_dozenal(max_val, frac_precision=frac_precision)} (dozenal)")
+        with _buffered_out() as write:
+            write("\nStatistics:\n")
+            write(f"  Count:      {n}\n")
+            write(f"  Sum:        {sum_val} (decimal) = {_doz_cached(sum_val, frac_precision=frac_precision)} (dozenal)\n")
+            write(f"  Mean:       {mean_val} (decimal) = {_doz_cached(mean_val, frac_precision=frac_precision)} (dozenal)\n")
+            write(f"  Median:     {median_val} (decimal) = {_doz_cached(median_val, frac_precision=frac_precision)} (dozenal)\n")
+            write(f"  Std Dev:    {std_val} (decimal) = {_doz_cached(std_val, frac_precision=frac_precision)} (dozenal)\n")
+            write(f"  Min:        {min_val} (decimal) = {_doz_cached(min_val, frac_precision=frac_precision)} (dozenal)\n")
+            write(f"  Max:        {max_val} (decimal) = {_doz_cached(max_val, frac_precision=frac_precision)} (dozenal)\n")
     except Exception as e:
         print(f"Error: {e}")
     print()
@@ -331,7 +431,8 @@ def _handle_poly(frac_precision: int = 12) -> None:
         return
     
     try:
-        coeffs = [float(c) for c in coeff_str.split()]
+        # Plain floats keep the Horner loop off NumPy scalar arithmetic.
+        coeffs = _parse_float_list(coeff_str).tolist()
         x = float(x_str)
         result = polynomial_eval(coeffs, x, frac_precision=frac_precision)
         
@@ -355,8 +456,8 @@ def _handle_regression(frac_precision: int = 12) -> None:
         return
     
     try:
-        x_vals = [float(v) for v in x_str.split()]
-        y_vals = [float(v) for v in y_str.split()]
+        x_vals = _parse_float_list(x_str)
+        y_vals = _parse_float_list(y_str)
         result = linear_regression(x_vals, y_vals, frac_precision=frac_precision)
         
         print("\nLinear Regression Results:")
@@ -390,6 +491,47 @@ def _handle_eigen(frac_precision: int = 12) -> None:
     print()
 
 
+# Every handler takes the fractional precision, even those that only
+# format integers, so dispatch is a plain lookup-and-call.
+_COMMANDS: dict[str, Callable[[int], None]] = {
+    "help": lambda fp: _print_help(),
+    "convert": _handle_convert,
+    "calc": _handle_calc,
+    "table": _handle_table,
+    "sequence": _handle_sequence,
+    "compare": _handle_compare,
+    "matrix": _handle_matrix,
+    "stats": _handle_stats,
+    "trig": _handle_trig,
+    "poly": _handle_poly,
+    "regression": _handle_regression,
+    "eigen": _handle_eigen,
+}
+
+
+def _line_reader() -> Callable[[], str | None]:
+    """Return a function that prompts for one command line, or None at EOF.
+
+    Piped or redirected input skips input()'s line-editing machinery and
+    reads lines directly; the prompt is still echoed so transcripts match.
+    """
+    stdin = sys.stdin
+    if stdin is not None and not stdin.isatty():
+        readline = stdin.readline
+        write = sys.stdout.write
+        
+        def get_line() -> str | None:
+            write("dozenal> ")
+            return readline() or None
+    else:
+        def get_line() -> str | None:
+            try:
+                return input("dozenal> ")
+            except EOFError:
+                return None
+    return get_line
+
+
 def run_interactive(frac_precision: int = 12) -> int:
     """Run the interactive REPL interface.
     
@@ -401,43 +543,39 @@ def run_interactive(frac_precision: int = 12) -> int:
     """
     _print_banner()
     
-    commands: dict[str, Callable[[], None]] = {
-        "help": _print_help,
-        "convert": lambda: _handle_convert(frac_precision),
-        "calc": lambda: _handle_calc(frac_precision),
-        "table": _handle_table,
-        "sequence": _handle_sequence,
-        "compare": _handle_compare,
-        "matrix": lambda: _handle_matrix(frac_precision),
-        "stats": lambda: _handle_stats(frac_precision),
-        "trig": lambda: _handle_trig(frac_precision),
-        "poly": lambda: _handle_poly(frac_precision),
-        "regression": lambda: _handle_regression(frac_precision),
-        "eigen": lambda: _handle_eigen(frac_precision),
-    }
+    commands = _COMMANDS
+    get_line = _line_reader()
     
+    # The handlers sit outside the command loop, so they are only re-entered
+    # after a Ctrl-C rather than set up again for every command.
     while True:
         try:
-            command = input("dozenal> ").strip().lower()
-            
-            if not command:
-                continue
-            
-            if command in ("quit", "exit", "q"):
-                print("Goodbye!")
-                return 0
-            
-            if command in commands:
-                commands[command]()
-            else:
-                print(f"Unknown command: {command}")
-                print("Type 'help' for available commands.")
-        
+            for line in iter(get_line, None):
+                if not line or line.isspace():
+                    continue
+                command = line.strip()
+                # Commands are usually typed in lowercase already.
+                if not command.islower():
+                    command = command.lower()
+                
+                if command in ("quit", "exit", "q"):
+                    print("Goodbye!")
+                    return 0
+                
+                handler = commands.get(command)
+                if handler is not None:
+                    handler(frac_precision)
+                else:
+                    print(f"Unknown command: {command}")
+                    print("Type 'help' for available commands.")
         except KeyboardInterrupt:
             print("\nUse 'quit' or 'exit' to leave.")
+            continue
         except EOFError:
-            print("\nGoodbye!")
-            return 0
+            # Input ran out while a command was prompting for its values.
+            pass
+        print("\nGoodbye!")
+        return 0
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 import pytest
 import math
 from dozenal.advanced_math import (
+    _array_to_dozenal,
     polynomial_eval,
     trigonometric_functions,
     linear_regression,
@@ -26,6 +27,14 @@ def test_polynomial_eval_zero():
     assert result["dozenal"] == "5"
 
 
+def test_polynomial_eval_high_degree():
+    """Test that long coefficient lists agree with the closed form."""
+    # sum of 0.5**k for k < 300 is 2 to double precision
+    result = polynomial_eval([1] * 300, 0.5)
+    assert float(result["decimal"]) == pytest.approx(2.0)
+    assert result["dozenal"] == "2"
+
+
 def test_trigonometric_functions_pi_over_2():
     """Test trig functions at π/2."""
     result = trigonometric_functions(math.pi / 2, frac_precision=6)
@@ -57,6 +66,19 @@ def test_trigonometric_functions_zero():
     assert float(result["tan"]["decimal"]) == pytest.approx(0.0)
 
 
+def test_trigonometric_functions_high_precision():
+    """Test trig functions at precisions too wide for the int64 fast path."""
+    from dozenal.dozenal_decimal_converter import decimal_to_dozenal
+
+    for precision in (18, 24):
+        result = trigonometric_functions(0.0, frac_precision=precision)
+        assert result["sin"]["dozenal"] == "0"
+        assert result["cos"]["dozenal"] == "1"
+
+        result = trigonometric_functions(0.5, frac_precision=precision)
+        assert result["sin"]["dozenal"] == decimal_to_dozenal(math.sin(0.5), frac_precision=precision)
+
+
 def test_linear_regression_perfect_fit():
     """Test linear regression with perfect linear data."""
     x = [1, 2, 3, 4, 5]
@@ -125,9 +147,111 @@ def test_eigenvalues_2x2_matrix():
     assert eigenvals_floats[1] == pytest.approx(3.0)
 
 
+def test_eigenvalues_non_symmetric_matrix():
+    """Test eigenvalues of a matrix that takes the general solver path."""
+    matrix = [[1, 2], [3, 4]]
+    result = eigenvalues(matrix, frac_precision=6)
+    
+    eigenvals_floats = sorted(float(e["decimal"]) for e in result["eigenvalues"])
+    assert eigenvals_floats[0] == pytest.approx((5 - math.sqrt(33)) / 2)
+    assert eigenvals_floats[1] == pytest.approx((5 + math.sqrt(33)) / 2)
+
+
+def test_eigenvalues_complex_symmetric_matrix():
+    """Test a complex symmetric (non-Hermitian) matrix avoids the Hermitian solver."""
+    result = eigenvalues([[1, 2j], [2j, 1]], frac_precision=6)
+    assert [e["dozenal"] for e in result["eigenvalues"]] == ["1", "1"]
+
+
 def test_eigenvalues_non_square_matrix():
     """Test that non-square matrix raises ValueError."""
     matrix = [[1, 2], [3, 4], [5, 6]]
     
     with pytest.raises(ValueError, match="square"):
         eigenvalues(matrix)
+
+
+def test_array_to_dozenal_exact_values_match_scalar_conversion():
+    """Test batch formatting agrees with decimal_to_dozenal on exact dozenal values."""
+    import numpy as np
+    from dozenal.dozenal_decimal_converter import decimal_to_dozenal
+
+    values = [0.0, 1.0, -14.0, 0.5, 1 / 12, -2.25, 144.125, 1e20, -3e18]
+    expected = [decimal_to_dozenal(v, frac_precision=6) for v in values]
+    assert _array_to_dozenal(np.array(values), 6) == expected
+
+
+def test_array_to_dozenal_truncates_like_scalar_conversion():
+    """Test computed floats give the same last digit as decimal_to_dozenal."""
+    import numpy as np
+    from dozenal.dozenal_decimal_converter import decimal_to_dozenal
+
+    values = [math.sin(1), -math.sin(1), 1 / 3, 0.1, 2.0000000001, 1e9 + 1 / 3, -1e-12]
+    for precision in (0, 4, 6, 12):
+        expected = [decimal_to_dozenal(v, frac_precision=precision) for v in values]
+        assert _array_to_dozenal(np.array(values), precision) == expected
+    assert _array_to_dozenal(np.array([math.sin(1)]), 6) == ["0.T1208T"]
+
+
+def test_array_to_dozenal_wide_precision():
+    """Test precisions too wide for exact float scaling fall back to the scalar path."""
+    import numpy as np
+    from dozenal.dozenal_decimal_converter import decimal_to_dozenal
+
+    values = [0.0, -2.25, 1 / 3, 1e20]
+    for precision in (18, 20, 300):
+        expected = [decimal_to_dozenal(v, frac_precision=precision) for v in values]
+        assert _array_to_dozenal(np.array(values), precision) == expected
+
+    result = linear_regression([1, 2, 3], [2, 4, 6], frac_precision=20)
+    assert result["r_squared"]["dozenal"] == "1"
+    evals = eigenvalues([[2, 0], [0, 3]], frac_precision=18)["eigenvalues"]
+    assert [e["dozenal"] for e in evals] == ["2", "3"]
+
+
+def test_cached_results_are_read_only():
+    """Test repeated calls share a cached, immutable result."""
+    first = trigonometric_functions(1.25, frac_precision=6)
+    assert trigonometric_functions(1.25, frac_precision=6) is first
+    with pytest.raises(TypeError):
+        first["sin"]["dozenal"] = "0"
+
+    # Signed zeros compare equal but must not share a cache entry
+    assert trigonometric_functions(0.0)["sin"]["decimal"] == "0.0"
+    assert trigonometric_functions(-0.0)["sin"]["decimal"] == "-0.0"
+    assert polynomial_eval([-0.0, 1.0], 0.0)["decimal"] == "0.0"
+    assert polynomial_eval([-0.0, 1.0], -0.0)["decimal"] == "-0.0"
+    assert polynomial_eval([0.0, 1.0], -0.0)["decimal"] == "0.0"
+
+    poly = polynomial_eval([1, 2, 3], 2)
+    assert polynomial_eval((1, 2, 3), 2) is poly
+    with pytest.raises(TypeError):
+        poly["decimal"] = "0"
+
+
+def test_horner_kernel_matches_python_loop():
+    """Test the Horner kernel (jitted when numba is installed) against the loop."""
+    import numpy as np
+    from dozenal.advanced_math import _horner, _jit_horner
+
+    coeffs = [((i * 7) % 11 - 5) / 3 for i in range(400)]
+    expected = 0.0
+    for c in reversed(coeffs):
+        expected = expected * 0.97 + c
+    for horner in (_horner, _jit_horner() or _horner):
+        assert horner(np.asarray(coeffs, dtype=np.float64), 0.97) == expected
+    assert polynomial_eval(coeffs, 0.97)["decimal"] == str(expected)
+
+
+def test_import_does_not_load_numba():
+    """Test numba is only imported once a long polynomial needs it."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    import dozenal
+
+    src = str(Path(dozenal.__file__).resolve().parents[1])
+    code = f"import sys; sys.path.insert(0, {src!r}); import dozenal.advanced_math; print('numba' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
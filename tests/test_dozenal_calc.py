@@ -1,5 +1,5 @@
 import pytest
-from decimal import Decimal
+from decimal import Decimal, getcontext
 
 from dozenal.dozenal_calc import calculate
 
@@ -32,6 +32,13 @@ def test_fractional_precision_controls_output() -> None:
     assert result.dozenal == "1"
 
 
+def test_fraction_rounding_up_carries_into_integer() -> None:
+    assert calculate("1/3*3").dozenal == "1"
+    assert calculate("-1/3*3").dozenal == "-1"
+    assert calculate("5+1/3*3").dozenal == "6"
+    assert calculate("1/9*9", frac_precision=2).dozenal == "1"
+
+
 def test_invalid_expression_raises() -> None:
     with pytest.raises(ValueError):
         calculate("1++2")
@@ -40,3 +47,26 @@ def test_invalid_expression_raises() -> None:
 def test_mismatched_parentheses() -> None:
     with pytest.raises(ValueError):
         calculate("(1+2")
+
+
+def test_calculate_leaves_global_precision_alone() -> None:
+    before = getcontext().prec
+    result = calculate("1/3", frac_precision=40)
+    assert getcontext().prec == before
+    assert result.dozenal == "0.4"
+
+
+def test_lowercase_digits_and_error_messages() -> None:
+    assert calculate("t+e").decimal == Decimal(21)
+    with pytest.raises(ValueError, match="'x'"):
+        calculate("1+x")
+
+
+def test_repeated_expressions_reuse_compiled_postfix() -> None:
+    from dozenal.dozenal_calc import _compile
+
+    _compile.cache_clear()
+    first = calculate("E/2")
+    second = calculate(" e/2 ")
+    assert first == second
+    assert _compile.cache_info().hits == 1
@@ -45,3 +45,43 @@ def test_invalid_strings():
 def test_negative_values():
     assert decimal_to_dozenal(-14) == "-12"
     assert int(dozenal_to_decimal("-12")) == -14
+
+
+def test_long_fractional_parts_keep_precision():
+    assert dozenal_to_decimal("0.16") == Decimal("0.125")
+    # 1 - 12**-30 must not round up to 1 at the default 28-digit precision
+    assert dozenal_to_decimal("0." + "E" * 30) < 1
+    with pytest.raises(ValueError, match="'G'"):
+        dozenal_to_decimal("1.2G")
+
+
+def test_fractional_digits_truncate_without_trailing_zeros():
+    # 1/7 = 0.186T35186T35... in dozenal
+    assert decimal_to_dozenal(Decimal(1) / Decimal(7), frac_precision=6) == "0.186T35"
+    # 0.125 = 0.16 in dozenal; one place truncates to 0.1
+    assert decimal_to_dozenal(Decimal("0.125"), frac_precision=1) == "0.1"
+    # 0.001 has no nonzero dozenal digit in the first place
+    assert decimal_to_dozenal(Decimal("0.001"), frac_precision=1) == "0"
+    # ...and a negative value that truncates to zero drops its sign
+    assert decimal_to_dozenal(Decimal("-0.001"), frac_precision=1) == "0"
+    assert decimal_to_dozenal(-0.0001, frac_precision=2) == "0"
+    assert decimal_to_dozenal(-0.5, frac_precision=0) == "0"
+    assert decimal_to_dozenal(Decimal("-1.001"), frac_precision=1) == "-1"
+    # A rounded repeating decimal still lands on the exact dozenal fraction
+    assert decimal_to_dozenal(Decimal(2) / Decimal(9), frac_precision=6) == "0.28"
+    # ...and one that lands on the next integer carries into it
+    assert decimal_to_dozenal(Decimal("0." + "9" * 27), frac_precision=2) == "1"
+    assert decimal_to_dozenal(Decimal("5." + "9" * 30), frac_precision=2) == "6"
+
+
+def test_large_integer_roundtrips():
+    assert decimal_to_dozenal(12**500) == "1" + "0" * 500
+    assert decimal_to_dozenal(-(12**500 - 1)) == "-" + "E" * 500
+    n = 7**2000 + 12**900
+    assert dozenal_to_decimal(decimal_to_dozenal(n)) == n
+
+
+def test_float_conversion_without_simplify():
+    # The exact binary value of 1/12 is slightly below one twelfth
+    assert decimal_to_dozenal(1/12, frac_precision=6, simplify=False) == "0.0EEEEE"
+    assert decimal_to_dozenal(-2.5, frac_precision=6, simplify=False) == "-2.6"
@@ -68,3 +68,161 @@ def test_handle_sequence_powers(mock_input, capsys):
     assert "1" in captured.out
     assert "10" in captured.out
     assert "100" in captured.out
+
+
+def test_products_table_matches_converter():
+    """Test the precomputed table agrees with direct conversion."""
+    from dozenal.dozenal_decimal_converter import decimal_to_dozenal
+    from dozenal.interactive import _PRODUCTS
+
+    assert len(_PRODUCTS) == 12
+    for i, row in enumerate(_PRODUCTS, 1):
+        assert row == [decimal_to_dozenal(i * j) for j in range(1, 13)]
+
+
+def test_dozenal_array_matches_converter():
+    """Test batch conversion against the scalar converter."""
+    from dozenal.dozenal_decimal_converter import decimal_to_dozenal
+    from dozenal.interactive import _dozenal_array
+
+    values = [0, 1, 11, 12, 143, 144, 1727, 2**40, -13]
+    assert _dozenal_array(values) == [decimal_to_dozenal(v) for v in values]
+    assert _dozenal_array([]) == []
+    # Too large for int64: handled by the scalar fallback.
+    assert _dozenal_array([12 ** 19]) == ["1" + "0" * 19]
+
+
+def test_run_interactive_dispatch(monkeypatch, capsys):
+    """Test that the REPL dispatches piped commands and exits cleanly."""
+    from dozenal.interactive import run_interactive
+
+    monkeypatch.setattr("sys.stdin", StringIO("\nTABLE\ncompare\n144\nbogus\nquit\n"))
+
+    assert run_interactive() == 0
+    captured = capsys.readouterr()
+
+    assert "Dozenal Multiplication Table" in captured.out
+    assert "Dozenal (base-12): 100" in captured.out
+    assert "Unknown command: bogus" in captured.out
+    assert captured.out.rstrip().endswith("Goodbye!")
+
+
+def test_run_interactive_eof(monkeypatch, capsys):
+    """Test that running out of piped input ends the session."""
+    from dozenal.interactive import run_interactive
+
+    monkeypatch.setattr("sys.stdin", StringIO("help\n"))
+
+    assert run_interactive() == 0
+    out = capsys.readouterr().out
+    assert out.count("dozenal> ") == 2
+    assert out.rstrip().endswith("Goodbye!")
+
+
+def test_int_to_dozenal_small_matches_converter():
+    """Test the integer fast path, including the wide-value fallback."""
+    from dozenal.dozenal_decimal_converter import decimal_to_dozenal
+    from dozenal.interactive import _int_to_dozenal_small
+
+    for n in [0, 1, 11, 12, -12, 144, 1727, 12 ** 16 - 1, 12 ** 16, -(12 ** 20)]:
+        assert _int_to_dozenal_small(n) == decimal_to_dozenal(n)
+
+
+@patch('builtins.input')
+def test_handle_stats(mock_input, capsys):
+    """Test the statistics summary and its error handling."""
+    from dozenal.interactive import _handle_stats
+
+    mock_input.return_value = "2 4 4 4 5 5 7 9"
+    _handle_stats()
+    out = capsys.readouterr().out
+    assert "Count:      8" in out
+    assert "Sum:        40.0 (decimal) = 34 (dozenal)" in out
+    assert "Mean:       5.0" in out
+    assert "Std Dev:    2.0" in out
+    assert "Min:        2.0" in out
+    assert "Max:        9.0" in out
+
+    mock_input.return_value = "1 2 x"
+    _handle_stats()
+    assert "Error:" in capsys.readouterr().out
+
+    mock_input.return_value = "   "
+    _handle_stats()
+    assert "No values entered." in capsys.readouterr().out
+
+
+def test_doz_cached_keys_on_type():
+    """Test the REPL conversion cache keeps equal values of different types apart."""
+    from decimal import Decimal
+    from dozenal.dozenal_decimal_converter import decimal_to_dozenal
+    from dozenal.interactive import _doz_cached, _doz_memo
+
+    _doz_memo.cache_clear()
+    for value in [0.5, Decimal("0.5"), 2, 2.0, 0.5]:
+        assert _doz_cached(value) == decimal_to_dozenal(value)
+    assert _doz_cached(0.1, frac_precision=4) == decimal_to_dozenal(0.1, frac_precision=4)
+    info = _doz_memo.cache_info()
+    assert info.hits == 1
+    assert info.currsize == 5
+
+
+@patch('builtins.input')
+def test_handle_matrix_operations(mock_input, capsys):
+    """Test matrix multiplication and determinant through the REPL helper."""
+    from dozenal.interactive import _handle_matrix
+
+    mock_input.side_effect = ["2", "1", "2", "3", "4", "5", "6", "7", "8"]
+    _handle_matrix()
+    out = capsys.readouterr().out
+    # [[1,2],[3,4]] @ [[5,6],[7,8]] = [[19,22],[43,50]] = [[17,1T],[37,42]]
+    assert "17" in out and "1T" in out and "37" in out and "42" in out
+
+    mock_input.side_effect = ["3", "2", "0", "0", "6"]
+    _handle_matrix()
+    assert "Determinant (dozenal): 10" in capsys.readouterr().out
+
+
+def test_dozenal_array_large_batch():
+    """Test a larger batch, including negatives, matches the scalar converter."""
+    from dozenal.dozenal_decimal_converter import decimal_to_dozenal
+    from dozenal.interactive import _dozenal_array
+
+    values = list(range(-300, 300, 3))
+    assert _dozenal_array(values) == [decimal_to_dozenal(v) for v in values]
+
+
+@patch('builtins.input')
+def test_handle_poly_and_regression(mock_input, capsys):
+    """Test the polynomial and regression commands parse their number lists."""
+    from dozenal.interactive import _handle_poly, _handle_regression
+
+    mock_input.side_effect = ["1 2  3", "2"]
+    _handle_poly()
+    out = capsys.readouterr().out
+    assert "Decimal: 17.0" in out
+    assert "Dozenal: 15" in out
+
+    mock_input.side_effect = ["1 2 3 4", "3 5 7 9"]
+    _handle_regression()
+    out = capsys.readouterr().out
+    assert "Slope:" in out and "Intercept:" in out
+
+    mock_input.side_effect = ["1 2 x", "3 5 7"]
+    _handle_regression()
+    assert "Error:" in capsys.readouterr().out
+
+
+@patch('builtins.input')
+def test_run_interactive_tty_input(mock_input, monkeypatch, capsys):
+    """Test the input() path, including Ctrl-C and EOF inside a command."""
+    from dozenal.interactive import run_interactive
+
+    monkeypatch.setattr("sys.stdin", MagicMock(isatty=lambda: True))
+    mock_input.side_effect = ["  ", KeyboardInterrupt, "Compare", "145", "sequence", EOFError]
+
+    assert run_interactive() == 0
+    out = capsys.readouterr().out
+    assert "Use 'quit' or 'exit' to leave." in out
+    assert "Dozenal (base-12): 101" in out
+    assert out.rstrip().endswith("Goodbye!")